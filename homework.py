@@ -1,32 +1,43 @@
+import atexit
 import logging
 import os
+import queue
 import time
 
 import requests
 import telegram
 from dotenv import load_dotenv
 from http import HTTPStatus
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from types import MappingProxyType
 
 from exceptions import ApiAnsverError, RequestsError, StatusError
 
 load_dotenv()
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-handler = RotatingFileHandler('my_log.log',
-                              maxBytes=50000000,
-                              backupCount=5)
-logger.addHandler(handler)
-
 PRACTICUM_TOKEN = os.getenv('PRACTICUM_TOKEN')
 TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 
 ONE_DAY_IN_SECONDS = 86400
 RETRY_PERIOD = 600
+MAX_RETRY_PERIOD = ONE_DAY_IN_SECONDS // 4
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
+REQUEST_TIMEOUT = (5, 30)
+
+MISSING_TOKENS_MESSAGE = ('Отсутствие обязательных переменных '
+                          'окружения во время запуска бота: %s')
+REQUEST_ERROR_MESSAGE = 'Ошибка при отправке запроса: %s'
+DECODE_ERROR_MESSAGE = 'Ошибка при распаковке запроса: %s'
+FAILURE_MESSAGE = 'Сбой в работе программы: %s'
+STATUS_CODE_ERROR_MESSAGE = 'Любые другие сбои при запросе к эндпоинту'
+RESPONSE_TYPE_ERROR_MESSAGE = 'Тип данных не соответствует должному'
+NO_HOMEWORKS_MESSAGE = 'Отсутствие данных о работ в ответе'
+NO_CURRENT_DATE_MESSAGE = 'Отсутствие данных о времени в ответе'
+NO_HOMEWORK_NAME_MESSAGE = 'В ответе API домашки нет ключа homework_name'
+UNKNOWN_STATUS_MESSAGE = ('Неожиданный статус домашней работы,'
+                          'обнаруженный в ответе API')
 
 
 HOMEWORK_VERDICTS = {
@@ -34,6 +45,10 @@ HOMEWORK_VERDICTS = {
     'reviewing': 'Работа взята на проверку ревьюером.',
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
 }
+VERDICT_TEMPLATES = MappingProxyType({
+    status: f'Изменился статус проверки работы "{{name}}". {verdict}'
+    for status, verdict in HOMEWORK_VERDICTS.items()
+})
 
 
 def check_tokens():
@@ -41,15 +56,10 @@ def check_tokens():
     all_tokens = {'PRACTICUM_TOKEN': PRACTICUM_TOKEN,
                   'TELEGRAM_TOKEN': TELEGRAM_TOKEN,
                   'TELEGRAM_CHAT_ID': TELEGRAM_CHAT_ID}
-    broken_tokens = []
-    for token, value in all_tokens.items():
-        if value is None:
-            broken_tokens.append(token)
+    broken_tokens = [token for token, value in all_tokens.items()
+                     if value is None]
     if broken_tokens:
-        message = ('Отсутствие обязательных переменных'
-                   'окружения во время запуска бота: '
-                   f"{', '.join([i for i in broken_tokens])}")
-        logging.critical(message, exc_info=True)
+        logging.critical(MISSING_TOKENS_MESSAGE, ', '.join(broken_tokens))
         return False
     return True
 
@@ -58,11 +68,13 @@ def send_message(bot, message):
     """Отправляет сообщения."""
     try:
         bot.send_message(TELEGRAM_CHAT_ID, message)
-    except Exception:
+    except telegram.error.RetryAfter as error:
+        time.sleep(error.retry_after)
+        send_message(bot, message)
+    except telegram.error.TelegramError:
         logging.error('сбой при отправке сообщения в Telegram', exc_info=True)
     else:
-        logging.debug('удачная отправка любого сообщения в Telegram',
-                      exc_info=True)
+        logging.debug('удачная отправка любого сообщения в Telegram')
 
 
 def get_api_answer(timestamp):
@@ -71,38 +83,30 @@ def get_api_answer(timestamp):
         'from_date': timestamp
     }
     try:
-        api_answer = requests.get(ENDPOINT, params=params, headers=HEADERS)
+        api_answer = requests.get(ENDPOINT, params=params, headers=HEADERS,
+                                  timeout=REQUEST_TIMEOUT)
     except requests.RequestException as error:
-        message = f'Ошибка при отправке запроса: {error}'
-        raise RequestsError(message)
+        raise RequestsError(REQUEST_ERROR_MESSAGE % error)
     if api_answer.status_code != HTTPStatus.OK:
-        message = 'Любые другие сбои при запросе к эндпоинту'
-        raise ApiAnsverError(message)
+        raise ApiAnsverError(STATUS_CODE_ERROR_MESSAGE)
     try:
         return api_answer.json()
     except requests.JSONDecodeError as error:
-        message = f'Ошибка при распаковке запроса: {error}'
-        raise RequestsError(message)
+        raise RequestsError(DECODE_ERROR_MESSAGE % error)
 
 
 def check_response(response):
     """Проверяет корректность входных данных."""
     if not isinstance(response, dict):
-        message = 'Тип данных не соответствует должному'
-        raise TypeError(message)
-    if response.get('homeworks') is None:
-        message = 'Отсутствие данных о работ в ответе'
-        raise ApiAnsverError(message)
-    if response.get('current_date') is None:
-        message = 'Отсутствие данных о времени в ответе'
-        raise ApiAnsverError(message)
+        raise TypeError(RESPONSE_TYPE_ERROR_MESSAGE)
     homeworks = response.get('homeworks')
+    current_date = response.get('current_date')
     if homeworks is None:
-        message = 'Отсутствие ожидаемых ключей в ответе API'
-        raise TypeError(message)
+        raise ApiAnsverError(NO_HOMEWORKS_MESSAGE)
+    if current_date is None:
+        raise ApiAnsverError(NO_CURRENT_DATE_MESSAGE)
     if not isinstance(homeworks, list):
-        message = 'Тип данных не соответствует должному'
-        raise TypeError(message)
+        raise TypeError(RESPONSE_TYPE_ERROR_MESSAGE)
     return response
 
 
@@ -111,14 +115,11 @@ def parse_status(homework):
     homework_name = homework.get('homework_name')
     homework_status = homework.get('status')
     if homework_name is None:
-        message = 'В ответе API домашки нет ключа homework_name'
-        raise StatusError(message)
-    if homework_status not in HOMEWORK_VERDICTS:
-        message = ('Неожиданный статус домашней работы,'
-                   'обнаруженный в ответе API')
-        raise StatusError(message)
-    verdict = HOMEWORK_VERDICTS[homework_status]
-    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+        raise StatusError(NO_HOMEWORK_NAME_MESSAGE)
+    template = VERDICT_TEMPLATES.get(homework_status)
+    if template is None:
+        raise StatusError(UNKNOWN_STATUS_MESSAGE)
+    return template.format_map({'name': homework_name})
 
 
 def main():
@@ -127,37 +128,55 @@ def main():
         exit()
     bot = telegram.Bot(token=TELEGRAM_TOKEN)
     timestamp = int(time.time()) - ONE_DAY_IN_SECONDS
-    last_message = None
+    last_message_hash = None
+    retry_period = RETRY_PERIOD
     while True:
+        next_retry_period = retry_period
         try:
             request = get_api_answer(timestamp)
             response = check_response(request)
             new_homeworks = response.get('homeworks')
             if new_homeworks:
-                send_message(bot,
-                             parse_status(new_homeworks[0]))
+                for status in [parse_status(homework)
+                               for homework in new_homeworks]:
+                    send_message(bot, status)
+                retry_period = next_retry_period = RETRY_PERIOD
             else:
                 message = 'Пока нет никакой информации'
-                logging.info(message, exc_info=True)
+                logging.info(message)
+                next_retry_period = min(retry_period * 2, MAX_RETRY_PERIOD)
             timestamp = response.get('current_date', timestamp)
         except Exception as error:
-            message = f'Сбой в работе программы: {error}'
-            if message != last_message:
+            message = FAILURE_MESSAGE % error
+            message_hash = hash(message)
+            if message_hash != last_message_hash:
                 logging.error(error.args[0], exc_info=True)
                 send_message(bot, message)
-                last_message = message
+                last_message_hash = message_hash
         else:
-            last_message = None
+            last_message_hash = None
         finally:
-            time.sleep(RETRY_PERIOD)
+            time.sleep(retry_period)
+            retry_period = next_retry_period
 
 
 if __name__ == '__main__':
+    file_handler = RotatingFileHandler('main.log',
+                                       maxBytes=50000000,
+                                       backupCount=5,
+                                       encoding='utf-8')
+    file_handler.setFormatter(
+        logging.Formatter('%(asctime)s, %(levelname)s, %(message)s')
+    )
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter())
     logging.basicConfig(
         level=logging.DEBUG,
-        filename='main.log',
-        encoding='utf-8',
-        format='%(asctime)s, %(levelname)s, %(message)s'
+        handlers=[queue_handler]
     )
 
     main()
@@ -491,6 +491,34 @@ class TestHomework:
                 'метод бота `send_message`.'
             )
 
+    def test_send_message_retries_after_flood_limit(self, monkeypatch,
+                                                    random_message,
+                                                    homework_module):
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+
+        class MockedBotWithRetryAfter(utils.MockTelegramBot):
+            calls = 0
+
+            def send_message(self, *args, **kwargs):
+                MockedBotWithRetryAfter.calls += 1
+                if MockedBotWithRetryAfter.calls == 1:
+                    raise telegram.error.RetryAfter(1)
+                super().send_message(*args, **kwargs)
+
+        sleeps = []
+        monkeypatch.setattr(time, 'sleep', sleeps.append)
+        bot = MockedBotWithRetryAfter()
+        homework_module.send_message(bot, random_message)
+        assert MockedBotWithRetryAfter.calls == 2, (
+            'Убедитесь, что после `RetryAfter` сообщение отправляется '
+            'повторно.'
+        )
+        assert bot.is_message_sent and bot.text == random_message
+        assert sleeps == [1], (
+            'Убедитесь, что перед повторной отправкой бот ждёт '
+            '`retry_after` секунд.'
+        )
+
     def test_bot_initialized_in_main(self, homework_module):
         func_name = 'main'
         utils.check_function(
@@ -734,6 +762,48 @@ class TestHomework:
                     f'Вызов функции `main` завершился ошибкой: {e}'
                 ) from e
 
+    def test_main_retry_period_backoff_and_reset(self, monkeypatch,
+                                                 random_timestamp,
+                                                 current_timestamp,
+                                                 random_message,
+                                                 homework_module,
+                                                 data_with_new_hw_status):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        empty_data = {'homeworks': [], 'current_date': random_timestamp}
+        answers = iter([empty_data] * 4
+                       + [data_with_new_hw_status, empty_data])
+
+        def mock_response_get(*args, **kwargs):
+            return utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp,
+                data=next(answers), **kwargs
+            )
+
+        sleeps = []
+
+        def record_sleep(secs):
+            sleeps.append(secs)
+            if len(sleeps) == 6:
+                raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(time, 'sleep', record_sleep)
+        monkeypatch.setattr(homework_module, 'send_message',
+                            lambda bot, message: None)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert sleeps == [600, 1200, 2400, 4800, 600, 600], (
+            'Убедитесь, что пауза между запросами удваивается, пока новых '
+            'статусов нет, и сразу сбрасывается до `RETRY_PERIOD` при '
+            'изменении статуса.'
+        )
+
     def test_main_send_message_with_telegram_exception(self, monkeypatch,
                                                        random_timestamp,
                                                        current_timestamp,